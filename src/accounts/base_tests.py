@@ -0,0 +1,9 @@
+"""
+Base comum dos tests dos apps.
+"""
+from django.test import TestCase, override_settings
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class FastHasherTestCase(TestCase):
+    """TestCase com hasher de senha barato; o custo do PBKDF2 não é o que está sendo testado."""
@@ -0,0 +1,35 @@
+"""
+Fábricas compartilhadas pelos tests dos apps.
+
+Pensadas para uso dentro de ``setUpTestData``: os dados são criados uma vez por
+classe e cada test recebe uma cópia isolada.
+"""
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+
+from .models import UserModel
+
+
+def make_user(username, password='password'):
+    """Cria um User usando o email como username."""
+    return User.objects.create_user(username=username, email=username, password=password)
+
+
+def make_users(usernames, password='password', batch_size=None):
+    """
+    Cria vários Users com bulk_create, com a senha hasheada uma só vez.
+
+    Os Users são buscados de novo porque nem todo backend devolve a pk no bulk_create.
+    """
+    hashed = make_password(password)
+    User.objects.bulk_create([
+        User(username=username, email=username, password=hashed)
+        for username in usernames
+    ], batch_size=batch_size)
+    users = User.objects.in_bulk(usernames, field_name='username')
+    return [users[username] for username in usernames]
+
+
+def make_account(user, **fields):
+    """Cria o UserModel (conta da empresa) do ``user``."""
+    return UserModel.objects.create(user=user, **fields)
@@ -1,23 +1,21 @@
-from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
 from .models import UserModel
+from .factories import make_user, make_account
+from .base_tests import FastHasherTestCase
 
-class UserModelCRUDTests(TestCase):
+class UserModelCRUDTests(FastHasherTestCase):
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser@example.com',
-            email='testuser@example.com',
-            password='testpassword123'
-        )
-        self.user_model = UserModel.objects.create(
-            user=self.user,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user('testuser@example.com', 'testpassword123')
+        cls.user_model = make_account(
+            cls.user,
             name='Test User Profile',
             cnpj='11.222.333/0001-55',
             email='testuser@example.com'
         )
-        self.user_model_data = {
+        cls.user_model_data = {
             'name': 'New Test User',
             'cnpj': '12.345.678/0001-90',
             'email': 'newtestuser@example.com',
@@ -69,12 +67,8 @@ class UserModelCRUDTests(TestCase):
     def test_delete_user(self):
         """Testa a exclusão do usuário."""
         self.client.login(username='testuser@example.com', password='testpassword123')
-        user_model_to_delete = UserModel.objects.create(
-            user=User.objects.create_user(
-                username='deleteuser@example.com',
-                email='deleteuser@example.com',
-                password='deletepassword'
-            ),
+        user_model_to_delete = make_account(
+            make_user('deleteuser@example.com', 'deletepassword'),
             name='To Delete',
             cnpj='66.777.888/0001-55',
             email='delete@example.com'
@@ -0,0 +1,274 @@
+"""
+Benchmarks de desempenho dos apps (dashboard, employees, github, trello, accounts).
+
+Não é descoberto pelo ``manage.py test`` padrão; rode explicitamente:
+
+    py manage.py test dashboard.benchmarks
+
+Parâmetros por variáveis de ambiente:
+
+    BENCH_EMPLOYEES   funcionários na conta (padrão 50)
+    BENCH_REPOS       repositórios por funcionário (padrão 2)
+    BENCH_BOARDS      boards por funcionário (padrão 2)
+    BENCH_ACTIVITIES  total de commits e de cards gerados, 10^3 a 10^6 (padrão 1000)
+    BENCH_ROUNDS      requisições medidas por cenário (padrão 20)
+    BENCH_OUTPUT      arquivo JSON de resultados (padrão benchmark_results.json no diretório temporário)
+    BENCH_BASELINE    JSON de uma execução anterior para comparação (opcional; os parâmetros acima
+                      precisam ser os mesmos da execução do baseline)
+    BENCH_TOLERANCE   aumento relativo aceito no p95 em relação ao baseline (padrão 0.5)
+"""
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.factories import make_user, make_users, make_account
+from employees.models import Employee
+from github.models import RepositorioGitHub, AtividadeGitHub
+from trello.models import BoardTrello, CardTrello
+
+BATCH_SIZE = 5000
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class PerformanceBenchmarks(TestCase):
+    employees_count = _env_int('BENCH_EMPLOYEES', 50)
+    repos_per_employee = _env_int('BENCH_REPOS', 2)
+    boards_per_employee = _env_int('BENCH_BOARDS', 2)
+    activities_count = _env_int('BENCH_ACTIVITIES', 1000)
+    rounds = _env_int('BENCH_ROUNDS', 20)
+    output_path = os.environ.get('BENCH_OUTPUT', os.path.join(tempfile.gettempdir(), 'benchmark_results.json'))
+    baseline_path = os.environ.get('BENCH_BASELINE')
+    tolerance = float(os.environ.get('BENCH_TOLERANCE', 0.5))
+
+    @classmethod
+    def params(cls):
+        return {
+            'employees': cls.employees_count,
+            'repos_per_employee': cls.repos_per_employee,
+            'boards_per_employee': cls.boards_per_employee,
+            'activities': cls.activities_count,
+            'rounds': cls.rounds,
+        }
+
+    @classmethod
+    def setUpClass(cls):
+        # Baseline validado antes de gerar a massa: com parâmetros diferentes a comparação não faz sentido.
+        cls.results = {}
+        cls.baseline = {}
+        if cls.baseline_path:
+            with open(cls.baseline_path, encoding='utf-8') as f:
+                baseline = json.load(f)
+            if baseline.get('params') != cls.params():
+                raise ValueError(
+                    f'Parâmetros do baseline {baseline.get("params")} diferem da execução atual {cls.params()}; '
+                    'rode com os mesmos BENCH_* ou gere um novo baseline.'
+                )
+            cls.baseline = baseline.get('scenarios', {})
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        report = {
+            'params': cls.params(),
+            'scenarios': cls.results,
+        }
+        with open(cls.output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Gera a massa sintética: conta, funcionários, repositórios, boards e atividades."""
+        cls.password = 'benchpassword'
+        cls.account_user = make_user('bench@example.com', cls.password)
+        cls.account = make_account(
+            cls.account_user,
+            name='Bench Company',
+            cnpj='99.999.999/0001-99',
+            email='bench@example.com'
+        )
+
+        users = make_users(
+            [f'emp{i}@example.com' for i in range(cls.employees_count)],
+            cls.password,
+            batch_size=BATCH_SIZE
+        )
+        Employee.objects.bulk_create([
+            Employee(
+                user=user,
+                accounts=cls.account,
+                name=f'Employee {i}',
+                email=user.email,
+                function='Developer',
+                github_username=f'github{i}',
+                github_token=f'encrypted_github{i}',
+                trello_username=f'trello{i}',
+                trello_token=f'TRELLO_TOKEN_{i}'
+            )
+            for i, user in enumerate(users)
+        ], batch_size=BATCH_SIZE)
+        employees = list(Employee.objects.filter(accounts=cls.account).order_by('pk'))
+        cls.employee = employees[0]
+
+        RepositorioGitHub.objects.bulk_create([
+            RepositorioGitHub(employee=employee, nome_repositorio=f'repo-{employee.pk}-{r}')
+            for employee in employees
+            for r in range(cls.repos_per_employee)
+        ], batch_size=BATCH_SIZE)
+        BoardTrello.objects.bulk_create([
+            BoardTrello(employee=employee, nome_board=f'Board {employee.pk}-{b}', trello_board_id=f'B{employee.pk}X{b}')
+            for employee in employees
+            for b in range(cls.boards_per_employee)
+        ], batch_size=BATCH_SIZE)
+
+        # Atividades espalhadas pelos últimos 90 dias, em lotes para não estourar a memória.
+        agora = timezone.now()
+        for start in range(0, cls.activities_count, BATCH_SIZE):
+            stop = min(start + BATCH_SIZE, cls.activities_count)
+            AtividadeGitHub.objects.bulk_create([
+                AtividadeGitHub(
+                    employee=employees[i % len(employees)],
+                    commit_mensagem=f'Commit {i}',
+                    data_commit=agora - timezone.timedelta(minutes=i * 7 % (90 * 24 * 60))
+                )
+                for i in range(start, stop)
+            ])
+            CardTrello.objects.bulk_create([
+                CardTrello(
+                    employee=employees[i % len(employees)],
+                    trello_card_id=f'CARD{i}',
+                    data_criacao=agora - timezone.timedelta(minutes=i * 11 % (90 * 24 * 60))
+                )
+                for i in range(start, stop)
+            ])
+
+    def _measure(self, name, request, expected_status, before=None):
+        """
+        Executa ``request`` repetidas vezes e registra latência, queries e pico de memória.
+
+        ``before`` roda antes de cada execução, fora da medição.
+        """
+        before = before or (lambda: None)
+        before()
+        response = request()
+        self.assertEqual(response.status_code, expected_status)
+
+        timings = []
+        queries = 0
+        for _ in range(self.rounds):
+            before()
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                request()
+                timings.append((time.perf_counter() - start) * 1000)
+            queries = max(queries, len(ctx.captured_queries))
+
+        # Memória medida à parte: o tracemalloc distorce a latência.
+        before()
+        tracemalloc.start()
+        request()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        result = {
+            'p50_ms': round(_percentile(timings, 50), 3),
+            'p95_ms': round(_percentile(timings, 95), 3),
+            'max_ms': round(max(timings), 3),
+            'queries': queries,
+            'peak_memory_kb': round(peak_memory / 1024, 1),
+        }
+        self.results[name] = result
+        self._compare_with_baseline(name, result)
+        return result
+
+    def _compare_with_baseline(self, name, result):
+        """Compara com o baseline em subTests, para que uma regressão não interrompa os próximos cenários."""
+        previous = self.baseline.get(name)
+        if not previous:
+            return
+        with self.subTest(scenario=name, metric='queries'):
+            self.assertLessEqual(
+                result['queries'], previous['queries'],
+                f'{name}: número de queries aumentou ({previous["queries"]} -> {result["queries"]})'
+            )
+        limit = previous['p95_ms'] * (1 + self.tolerance)
+        with self.subTest(scenario=name, metric='p95_ms'):
+            self.assertLessEqual(
+                result['p95_ms'], limit,
+                f'{name}: p95 {result["p95_ms"]}ms acima do baseline {previous["p95_ms"]}ms'
+            )
+
+    def test_dashboard_geral(self):
+        """Mede o dashboard geral com e sem filtros."""
+        self.client.force_login(self.account_user)
+        url = reverse('dashboard_geral')
+        self._measure('dashboard_geral', lambda: self.client.get(url), 200)
+        self._measure(
+            'dashboard_geral_github_30d',
+            lambda: self.client.get(url, {'tipo': 'github', 'data': 30}),
+            200
+        )
+        self._measure(
+            'dashboard_geral_trello_90d',
+            lambda: self.client.get(url, {'tipo': 'trello', 'data': 90}),
+            200
+        )
+
+    def test_dashboard_funcionario(self):
+        """Mede o dashboard de um funcionário."""
+        self.client.force_login(self.account_user)
+        url = reverse('dashboard_funcionario', args=[self.employee.pk])
+        self._measure('dashboard_funcionario', lambda: self.client.get(url), 200)
+        self._measure(
+            'dashboard_funcionario_90d',
+            lambda: self.client.get(url, {'data': 90}),
+            200
+        )
+
+    def test_employee_list(self):
+        """Mede a listagem de funcionários da conta."""
+        self.client.force_login(self.account_user)
+        url = reverse('employee_list')
+        self._measure('employee_list', lambda: self.client.get(url), 200)
+
+    @mock.patch('github.views.get_github_commits')
+    def test_atualizar_todos_commits(self, mock_get_commits):
+        """Mede a sincronização de commits com a API do GitHub simulada."""
+        mock_get_commits.return_value = [
+            {"message": f"Commit {i}", "date": "2025-04-09T10:00:00Z"}
+            for i in range(10)
+        ]
+        self.client.force_login(self.employee.user)
+        url = reverse('atualizar_todos_commits')
+        self._measure('atualizar_todos_commits', lambda: self.client.post(url), 200)
+
+    @mock.patch('trello.views.sync_trello_cards_for_employee')
+    def test_atualizar_cards_trello(self, mock_sync_cards):
+        """Mede a view de sincronização de cards com o Trello simulado."""
+        self.client.force_login(self.employee.user)
+        url = reverse('atualizar-cards-trello', args=[self.employee.id])
+        self._measure('atualizar_cards_trello', lambda: self.client.post(url), 200)
+
+    def test_login(self):
+        """Mede o login da conta por email."""
+        url = reverse('login')
+        data = {'email': 'bench@example.com', 'password': self.password}
+        self._measure('login', lambda: self.client.post(url, data), 302, before=self.client.logout)
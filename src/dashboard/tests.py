@@ -1,33 +1,34 @@
 import json
-from django.test import TestCase, RequestFactory
+from django.test import RequestFactory
 from django.urls import reverse
 from django.utils import timezone
-from employees.models import Employee
 from github.models import AtividadeGitHub
 from trello.models import CardTrello
-from accounts.models import UserModel  
-from django.contrib.auth.models import User
+from accounts.factories import make_user, make_users, make_account
+from accounts.base_tests import FastHasherTestCase
+from employees.factories import make_employee
 
-class DashboardGeralViewTests(TestCase):
-    def setUp(self):
-        self.factory = RequestFactory()
-        self.django_user1 = User.objects.create_user(username='test1@example.com', password='password')
-        self.user1 = UserModel.objects.create(user=self.django_user1, email='test1@example.com', cnpj='TEST_CNPJ_1')
-        self.employee1 = Employee.objects.create(user=self.django_user1, accounts=self.user1, name='Employee 1')
+class DashboardGeralViewTests(FastHasherTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.django_user1, cls.django_user2 = make_users(['test1@example.com', 'test2@example.com'])
+        cls.user1 = make_account(cls.django_user1, email='test1@example.com', cnpj='TEST_CNPJ_1')
+        cls.employee1 = make_employee(cls.django_user1, cls.user1, name='Employee 1')
 
-        self.django_user2 = User.objects.create_user(username='test2@example.com', password='password')
-        self.user2 = UserModel.objects.create(user=self.django_user2, email='test2@example.com', cnpj='TEST_CNPJ_2')
-        self.employee2 = Employee.objects.create(user=self.django_user2, accounts=self.user2, name='Employee 2')
+        cls.user2 = make_account(cls.django_user2, email='test2@example.com', cnpj='TEST_CNPJ_2')
+        cls.employee2 = make_employee(cls.django_user2, cls.user2, name='Employee 2')
 
         agora_utc = timezone.now()
         fuso_horario_local = timezone.get_current_timezone()
         agora_local = timezone.localtime(agora_utc, fuso_horario_local)
 
-        AtividadeGitHub.objects.create(employee=self.employee1, data_commit=agora_local - timezone.timedelta(days=1))
-        CardTrello.objects.create(employee=self.employee1, data_criacao=agora_local - timezone.timedelta(days=2), trello_card_id='TRELLO_CARD_1')
-        AtividadeGitHub.objects.create(employee=self.employee2, data_commit=agora_local - timezone.timedelta(days=8))
-        CardTrello.objects.create(employee=self.employee2, data_criacao=agora_local - timezone.timedelta(days=3), trello_card_id='TRELLO_CARD_2')
+        AtividadeGitHub.objects.create(employee=cls.employee1, data_commit=agora_local - timezone.timedelta(days=1))
+        CardTrello.objects.create(employee=cls.employee1, data_criacao=agora_local - timezone.timedelta(days=2), trello_card_id='TRELLO_CARD_1')
+        AtividadeGitHub.objects.create(employee=cls.employee2, data_commit=agora_local - timezone.timedelta(days=8))
+        CardTrello.objects.create(employee=cls.employee2, data_criacao=agora_local - timezone.timedelta(days=3), trello_card_id='TRELLO_CARD_2')
 
+    def setUp(self):
+        self.factory = RequestFactory()
 
     def test_get_dashboard_geral_view(self):
         request = self.factory.get(reverse('dashboard_geral')) # Use 'dashboard_geral'
@@ -68,16 +69,19 @@ class DashboardGeralViewTests(TestCase):
         self.assertEqual(json.loads(response.context['grafico_data'])[1], 0)
         self.assertEqual(json.loads(response.context['grafico_cards'])[1], 1)
 
-class DashboardFuncionarioViewTests(TestCase):
+class DashboardFuncionarioViewTests(FastHasherTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.django_user = make_user('test@example.com')
+        cls.user = make_account(cls.django_user, email='test@example.com', cnpj='TEST_CNPJ')
+        cls.employee = make_employee(cls.django_user, cls.user, name='Test Employee')
+        agora = timezone.now()
+        AtividadeGitHub.objects.create(employee=cls.employee, data_commit=agora - timezone.timedelta(days=1))
+        CardTrello.objects.create(employee=cls.employee, data_criacao=agora - timezone.timedelta(days=2), trello_card_id='TRELLO_CARD_EMP')
+
     def setUp(self):
         self.factory = RequestFactory()
-        self.django_user = User.objects.create_user(username='test@example.com', password='password')
-        self.user = UserModel.objects.create(user=self.django_user, email='test@example.com', cnpj='TEST_CNPJ')
-        self.employee = Employee.objects.create(user=self.django_user, accounts=self.user, name='Test Employee')
-        agora = timezone.now()
-        AtividadeGitHub.objects.create(employee=self.employee, data_commit=agora - timezone.timedelta(days=1))
-        CardTrello.objects.create(employee=self.employee, data_criacao=agora - timezone.timedelta(days=2), trello_card_id='TRELLO_CARD_EMP')
-        
+
     def test_get_dashboard_funcionario_view(self):
         url = reverse('dashboard_funcionario', args=[self.employee.pk]) # Use 'dashboard_funcionario'
         response = self.client.get(url)
@@ -0,0 +1,9 @@
+"""
+Fábricas de funcionários para os tests dos apps.
+"""
+from .models import Employee
+
+
+def make_employee(user, account, **fields):
+    """Cria um Employee ligado ao ``user`` e à conta ``account``."""
+    return Employee.objects.create(user=user, accounts=account, **fields)
@@ -1,33 +1,33 @@
-from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, login, logout
 from .models import Employee
-from accounts.models import UserModel
+from .factories import make_employee
+from accounts.factories import make_user, make_users, make_account
+from accounts.base_tests import FastHasherTestCase
 from .forms import EmployeeForm, EmployeeLoginForm, TokenForm  # Certifique-se que todos existem
 
-class EmployeeCRUDTests(TestCase):
+class EmployeeCRUDTests(FastHasherTestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Criar um UserModel para associar aos funcionários
-        self.company_user = User.objects.create_user(
-            username='company@example.com',
-            email='company@example.com',
-            password='companypassword'
-        )
-        self.company_account = UserModel.objects.create(
-            user=self.company_user,
+        cls.company_user = make_user('company@example.com', 'companypassword')
+        cls.company_account = make_account(
+            cls.company_user,
             name='Test Company',
             cnpj='00.000.000/0001-00',
             email='company@example.com'
         )
 
-        self.employee_data = {
+        cls.employee_data = {
             'name': 'Test Employee',
             'email': 'employee@example.com',
             'password': 'employeepassword',
             'function': 'Developer'
         }
+
+    def setUp(self):
         self.client.login(username='company@example.com', password='companypassword')
 
     def test_create_employee(self):
@@ -45,18 +45,9 @@ class EmployeeCRUDTests(TestCase):
 
     def test_employee_list_view(self):
         """Testa a visualização da lista de funcionários."""
-        Employee.objects.create(
-            accounts=self.company_account,
-            name='Employee 1',
-            email='employee1@example.com',
-            user=User.objects.create_user(username='employee1@example.com', email='employee1@example.com', password='password1')
-        )
-        Employee.objects.create(
-            accounts=self.company_account,
-            name='Employee 2',
-            email='employee2@example.com',
-            user=User.objects.create_user(username='employee2@example.com', email='employee2@example.com', password='password2')
-        )
+        user1, user2 = make_users(['employee1@example.com', 'employee2@example.com'])
+        make_employee(user1, self.company_account, name='Employee 1', email='employee1@example.com')
+        make_employee(user2, self.company_account, name='Employee 2', email='employee2@example.com')
         response = self.client.get(reverse('employee_list'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Employee 1')
@@ -64,11 +55,11 @@ class EmployeeCRUDTests(TestCase):
 
     def test_employee_profile_view(self):
         """Testa a visualização do perfil do funcionário logado."""
-        employee = Employee.objects.create(
-            accounts=self.company_account,
+        employee = make_employee(
+            make_user('logged@example.com', 'loggedpassword'),
+            self.company_account,
             name='Logged Employee',
-            email='logged@example.com',
-            user=User.objects.create_user(username='logged@example.com', email='logged@example.com', password='loggedpassword')
+            email='logged@example.com'
         )
         self.client.logout()
         self.client.login(username='logged@example.com', password='loggedpassword')
@@ -79,12 +70,12 @@ class EmployeeCRUDTests(TestCase):
 
     def test_employee_edit_view(self):
         """Testa a visualização e atualização do perfil do funcionário."""
-        employee = Employee.objects.create(
-            accounts=self.company_account,
+        employee = make_employee(
+            make_user('edit@example.com', 'editpassword'),
+            self.company_account,
             name='To Edit',
             email='edit@example.com',
-            function='Tester',
-            user=User.objects.create_user(username='edit@example.com', email='edit@example.com', password='editpassword')
+            function='Tester'
         )
         updated_data = {
             'name': 'Edited Employee',
@@ -105,11 +96,11 @@ class EmployeeCRUDTests(TestCase):
 
     def test_employee_delete_view(self):
         """Testa a exclusão de um funcionário."""
-        employee_to_delete = Employee.objects.create(
-            accounts=self.company_account,
+        employee_to_delete = make_employee(
+            make_user('delete@example.com', 'deletepassword'),
+            self.company_account,
             name='To Delete',
-            email='delete@example.com',
-            user=User.objects.create_user(username='delete@example.com', email='delete@example.com', password='deletepassword')
+            email='delete@example.com'
         )
         self.assertEqual(Employee.objects.count(), 1)
         self.assertEqual(User.objects.count(), 2) # Inclui o company_user
@@ -120,12 +111,12 @@ class EmployeeCRUDTests(TestCase):
 
     def test_employee_login_view(self):
         """Testa o login de um funcionário."""
-        Employee.objects.create(
-            accounts=self.company_account,
+        make_employee(
+            make_user('login@example.com', 'loginpassword'),
+            self.company_account,
             name='Login User',
             email='login@example.com',
-            password='loginpassword',
-            user=User.objects.create_user(username='login@example.com', email='login@example.com', password='loginpassword')
+            password='loginpassword'
         )
         response = self.client.post(
             reverse('employee_login'),
@@ -138,12 +129,12 @@ class EmployeeCRUDTests(TestCase):
         """Testa o login com credenciais inválidas de funcionário."""
         self.client.logout()  # Desloga qualquer usuário logado antes do teste
 
-        Employee.objects.create(
-            accounts=self.company_account,
+        make_employee(
+            make_user('invalid@example.com', 'correctpassword'),
+            self.company_account,
             name='Invalid Login',
             email='invalid@example.com',
-            password='correctpassword',
-            user=User.objects.create_user(username='invalid@example.com', email='invalid@example.com', password='correctpassword')
+            password='correctpassword'
         )
 
         self.assertFalse(self.client.session.get('_auth_user_id', False))  # Verifique antes (agora deve ser False)
@@ -159,12 +150,12 @@ class EmployeeCRUDTests(TestCase):
         
     def test_employee_logout_view(self):
         """Testa o logout de um funcionário."""
-        Employee.objects.create(
-            accounts=self.company_account,
+        make_employee(
+            make_user('logout@example.com', 'logoutpassword'),
+            self.company_account,
             name='Logout User',
             email='logout@example.com',
-            password='logoutpassword',
-            user=User.objects.create_user(username='logout@example.com', email='logout@example.com', password='logoutpassword')
+            password='logoutpassword'
         )
         self.client.login(username='logout@example.com', password='logoutpassword')
         self.assertTrue(self.client.session.get('_auth_user_id', False))
@@ -174,11 +165,11 @@ class EmployeeCRUDTests(TestCase):
 
     def test_token_update_view(self):
         """Testa a visualização e atualização dos tokens do funcionário."""
-        employee = Employee.objects.create(
-            accounts=self.company_account,
+        employee = make_employee(
+            make_user('token@example.com', 'tokenpassword'),
+            self.company_account,
             name='Token User',
-            email='token@example.com',
-            user=User.objects.create_user(username='token@example.com', email='token@example.com', password='tokenpassword')
+            email='token@example.com'
         )
         initial_token = 'initial_trello_token'
         initial_github_token = 'initial_github_token'
@@ -1,52 +1,41 @@
-from django.test import TestCase
 from django.urls import reverse
-from django.contrib.auth.models import User
-from employees.models import Employee
 from .models import RepositorioGitHub, AtividadeGitHub
-from accounts.models import UserModel
+from accounts.factories import make_user, make_account
+from accounts.base_tests import FastHasherTestCase
+from employees.factories import make_employee
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.test.client import RequestFactory
 from unittest import mock
 
 
-class GitHubCRUDTests(TestCase):
+class GitHubCRUDTests(FastHasherTestCase):
 
-    def setUp(self):
-        # Criar um usuário de teste
-        self.test_user = User.objects.create_user(
-            username='testuser@example.com',
-            email='testuser@example.com',
-            password='testpassword'
-        )
-
-        # Criar um UserModel associado ao usuário de teste
-        try:
-            self.company_account = UserModel.objects.get(user=self.test_user)
-        except UserModel.DoesNotExist:
-            self.company_account = UserModel.objects.create(user=self.test_user)
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = make_user('testuser@example.com', 'testpassword')
+        cls.company_account = make_account(cls.test_user)
 
         # Criar um funcionário associado ao usuário e ao UserModel
-        try:
-            self.employee = Employee.objects.get(user=self.test_user)
-        except Employee.DoesNotExist:
-            self.employee = Employee.objects.create(
-                user=self.test_user,
-                accounts=self.company_account,  # Associe o UserModel aqui
-                name='Test Employee',
-                email='test@example.com',
-                password='testpassword',
-                function='Developer'
-            )
-
-        self.repositorio_data = {
+        cls.employee = make_employee(
+            cls.test_user,
+            cls.company_account,
+            name='Test Employee',
+            email='test@example.com',
+            password='testpassword',
+            function='Developer'
+        )
+
+        cls.repositorio_data = {
             'nome_repositorio': 'meu-repositorio'
         }
-        self.atividade_data = {
-            'employee': self.employee.pk,
+        cls.atividade_data = {
+            'employee': cls.employee.pk,
             'commit_mensagem': 'Adicionando nova funcionalidade',
             'data_commit': '2025-04-09T19:00:00-03:00'
         }
+
+    def setUp(self):
         self.factory = RequestFactory()
 
     def _authenticate_user(self):
@@ -118,33 +107,30 @@ class GitHubCRUDTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(RepositorioGitHub.objects.count(), 0)
     
-class AtualizarCommitsViewTests(TestCase):
-    def setUp(self):
-        self.test_user = User.objects.create_user(
-            username='testuser@example.com',
-            email='testuser@example.com',
-            password='testpassword'
-        )
-        try:
-            self.company_account = UserModel.objects.get(user=self.test_user)
-        except UserModel.DoesNotExist:
-            self.company_account = UserModel.objects.create(user=self.test_user)
-
-        self.employee = Employee.objects.create(
-            user=self.test_user,
-            accounts=self.company_account,
+class AtualizarCommitsViewTests(FastHasherTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = make_user('testuser@example.com', 'testpassword')
+        cls.company_account = make_account(cls.test_user)
+
+        cls.employee = make_employee(
+            cls.test_user,
+            cls.company_account,
             github_username='testgithubuser',
-            github_token=self.encrypt_token('testgithubtoken'),
+            github_token=cls.encrypt_token('testgithubtoken'),
             name='Test Employee',
             email='test@example.com',
             password='testpassword',
             function='Developer'
         )
-        self.repo1 = RepositorioGitHub.objects.create(employee=self.employee, nome_repositorio='repo1')
-        self.repo2 = RepositorioGitHub.objects.create(employee=self.employee, nome_repositorio='repo2')
+        cls.repo1 = RepositorioGitHub.objects.create(employee=cls.employee, nome_repositorio='repo1')
+        cls.repo2 = RepositorioGitHub.objects.create(employee=cls.employee, nome_repositorio='repo2')
+
+    def setUp(self):
         self.factory = RequestFactory()
 
-    def encrypt_token(self, token):
+    @staticmethod
+    def encrypt_token(token):
         return f"encrypted_{token}"
 
     def _authenticate_user(self):
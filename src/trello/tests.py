@@ -1,31 +1,27 @@
-from django.test import TestCase, RequestFactory
+from django.test import RequestFactory
 from django.urls import reverse
-from django.contrib.auth.models import User
-from employees.models import Employee
 from .models import BoardTrello
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.contrib.auth.middleware import AuthenticationMiddleware
 from unittest import mock
-from accounts.models import UserModel
+from accounts.factories import make_user, make_account
+from accounts.base_tests import FastHasherTestCase
+from employees.factories import make_employee
 
-class BoardTrelloCRUDTests(TestCase):
-    def setUp(self):
-        self.factory = RequestFactory()
-        self.test_user = User.objects.create_user(
-            username='testuser@example.com',
-            email='testuser@example.com',
-            password='testpassword'
-        )
-        try:
-            self.company_account = UserModel.objects.get(user=self.test_user)
-        except UserModel.DoesNotExist:
-            self.company_account = UserModel.objects.create(user=self.test_user)
+class BoardTrelloCRUDTests(FastHasherTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = make_user('testuser@example.com', 'testpassword')
+        cls.company_account = make_account(cls.test_user)
 
-        self.employee = Employee.objects.create(
-            user=self.test_user,
-            accounts=self.company_account,  # Associe o UserModel aqui
+        cls.employee = make_employee(
+            cls.test_user,
+            cls.company_account,
             name='Test Employee'
         )
+
+    def setUp(self):
+        self.factory = RequestFactory()
         self.client.force_login(self.test_user)
 
     def _authenticate_user(self):
@@ -59,13 +55,10 @@ class BoardTrelloCRUDTests(TestCase):
         self.assertContains(response, 'Board 2')
 
         # Cria um board para outro usuário e verifica que não aparece na lista
-        other_user = User.objects.create_user(username='other@example.com', password='otherpassword')
-        try:
-            other_account = UserModel.objects.get(user=other_user)
-        except UserModel.DoesNotExist:
-            # Gere um CNPJ único para o teste
-            other_account = UserModel.objects.create(user=other_user, cnpj='TEST_CNPJ_OTHER')
-        other_employee = Employee.objects.create(user=other_user, accounts=other_account, name='Other Employee')
+        other_user = make_user('other@example.com', 'otherpassword')
+        # CNPJ distinto do da conta principal
+        other_account = make_account(other_user, cnpj='TEST_CNPJ_OTHER')
+        other_employee = make_employee(other_user, other_account, name='Other Employee')
         BoardTrello.objects.create(employee=other_employee, nome_board='Other Board', trello_board_id='OTHERBOARD')
         response = self.client.get(reverse('board-list'))
         self.assertNotContains(response, 'Other Board')
@@ -87,28 +80,24 @@ class BoardTrelloCRUDTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(BoardTrello.objects.count(), 0)
 
-class AtualizarCardsTrelloViewTests(TestCase):
-    def setUp(self):
-        self.test_user = User.objects.create_user(
-            username='testuser@example.com',
-            email='testuser@example.com',
-            password='testpassword'
-        )
-        try:
-            self.company_account = UserModel.objects.get(user=self.test_user)
-        except UserModel.DoesNotExist:
-            self.company_account = UserModel.objects.create(user=self.test_user)
+class AtualizarCardsTrelloViewTests(FastHasherTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = make_user('testuser@example.com', 'testpassword')
+        cls.company_account = make_account(cls.test_user)
 
-        self.employee = Employee.objects.create(
-            user=self.test_user,
-            accounts=self.company_account,
+        cls.employee = make_employee(
+            cls.test_user,
+            cls.company_account,
             name='Test Employee',
-            trello_username='TEST_USER',  # Correção aqui
-            trello_token='TEST_TOKEN'     # Correção aqui
+            trello_username='TEST_USER',
+            trello_token='TEST_TOKEN'
         )
+        cls.board1 = BoardTrello.objects.create(employee=cls.employee, nome_board='Board 1', trello_board_id='BOARD1')
+        cls.board2 = BoardTrello.objects.create(employee=cls.employee, nome_board='Board 2', trello_board_id='BOARD2')
+
+    def setUp(self):
         self.client.force_login(self.test_user)
-        self.board1 = BoardTrello.objects.create(employee=self.employee, nome_board='Board 1', trello_board_id='BOARD1')
-        self.board2 = BoardTrello.objects.create(employee=self.employee, nome_board='Board 2', trello_board_id='BOARD2')
 
     @mock.patch('trello.views.sync_trello_cards_for_employee')
     def test_atualizar_cards_view(self, mock_sync_cards):